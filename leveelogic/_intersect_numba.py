@@ -0,0 +1,59 @@
+"""Numba compiled polyline intersection kernel
+
+This module is only imported when numba is available, the caller
+(helpers.polyline_polyline_intersections_np) falls back to the plain
+numpy implementation if the import fails.
+"""
+import numpy as np
+from numba import njit
+
+
+# explicit signature so the kernel compiles at import time and
+# cache=True so the compiled code is written to __pycache__ and reused
+# across processes instead of recompiling on every first call
+@njit("f8[:, :](f8[:, ::1], f8[:, ::1])", cache=True, fastmath=True)
+def intersect_polylines(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Find all intersections between the segments of polyline a and b
+
+    Args:
+        a (np.ndarray): (M, 2) array with the points of the first polyline
+        b (np.ndarray): (N, 2) array with the points of the second polyline
+
+    Returns:
+        np.ndarray: (K, 2) array with the intersection points (unsorted,
+        may contain duplicates for crossings on shared segment endpoints)
+    """
+    m = a.shape[0] - 1
+    n = b.shape[0] - 1
+    out = np.empty((m * n, 2), dtype=np.float64)
+    k = 0
+    for i in range(m):
+        ax1, az1 = a[i, 0], a[i, 1]
+        ax2, az2 = a[i + 1, 0], a[i + 1, 1]
+        dax, daz = ax2 - ax1, az2 - az1
+        ca = daz * ax1 - dax * az1
+        for j in range(n):
+            bx1, bz1 = b[j, 0], b[j, 1]
+            bx2, bz2 = b[j + 1, 0], b[j + 1, 1]
+
+            # sign product test, both endpoints of b on the same side
+            # of segment a means no intersection (and vice versa)
+            f1 = dax * bz1 - daz * bx1 + ca
+            f2 = dax * bz2 - daz * bx2 + ca
+            if f1 * f2 > 0:
+                continue
+            dbx, dbz = bx2 - bx1, bz2 - bz1
+            cb = dbz * bx1 - dbx * bz1
+            g1 = dbx * az1 - dbz * ax1 + cb
+            g2 = dbx * az2 - dbz * ax2 + cb
+            if g1 * g2 > 0:
+                continue
+
+            denom = dax * dbz - daz * dbx
+            if denom == 0.0:  # parallel / collinear
+                continue
+            t = ((bx1 - ax1) * dbz - (bz1 - az1) * dbx) / denom
+            out[k, 0] = ax1 + t * dax
+            out[k, 1] = az1 + t * daz
+            k += 1
+    return out[:k]
@@ -1,3 +1,4 @@
+from bisect import bisect_left
 from copy import deepcopy
 from math import isnan, nan
 import numpy as np
@@ -29,6 +30,11 @@ class AlgorithmBermWSBD(Algorithm):
     ditch_land_side: float = nan
 
     def _check_input(self):
+        # bind the deep attribute chains once
+        wns = self.ds.model.datastructure.waternetcreatorsettings[0]
+        emb = wns.EmbankmentCharacteristics
+        ditch = wns.DitchCharacteristics
+
         # if we are using the algorithm to not only fill the ditch do we have this soilcode for the berm?
         if self.width > 0 or self.fixed_x is not None:
             if not self.ds.has_soilcode(self.soilcode):
@@ -38,51 +44,21 @@ class AlgorithmBermWSBD(Algorithm):
 
             # do we have the toe char point?
             try:
-                self.embankement_toe_land_side = float(
-                    self.ds.model.datastructure.waternetcreatorsettings[
-                        0
-                    ].EmbankmentCharacteristics.EmbankmentToeLandSide
-                )
+                self.embankement_toe_land_side = float(emb.EmbankmentToeLandSide)
             except:
                 raise AlgorithmInputCheckError(
                     "The given stix file has no waternet creator settings where the embankment toe land side point is set which is required for this algorithm to run."
                 )
 
         # Ditch information, maybe for later
-        if (
-            not self.ds.model.datastructure.waternetcreatorsettings[
-                0
-            ].DitchCharacteristics.DitchEmbankmentSide
-            == "NaN"
-        ):
-            self.ditch_embankement_side = float(
-                self.ds.model.datastructure.waternetcreatorsettings[
-                    0
-                ].DitchCharacteristics.DitchEmbankmentSide
-            )
+        if not ditch.DitchEmbankmentSide == "NaN":
+            self.ditch_embankement_side = float(ditch.DitchEmbankmentSide)
 
         # MAYBE FOR PL REASONS
-        # self.ditch_bottom_embankement_side = float(
-        #     self.ds.model.datastructure.waternetcreatorsettings[
-        #         0
-        #     ].DitchCharacteristics.DitchBottomEmbankmentSide
-        # )
-        # self.ditch_bottom_land_side = float(
-        #     self.ds.model.datastructure.waternetcreatorsettings[
-        #         0
-        #     ].DitchCharacteristics.DitchBottomLandSide
-        # )
-        if (
-            not self.ds.model.datastructure.waternetcreatorsettings[
-                0
-            ].DitchCharacteristics.DitchLandSide
-            == "NaN"
-        ):
-            self.ditch_land_side = float(
-                self.ds.model.datastructure.waternetcreatorsettings[
-                    0
-                ].DitchCharacteristics.DitchLandSide
-            )
+        # self.ditch_bottom_embankement_side = float(ditch.DitchBottomEmbankmentSide)
+        # self.ditch_bottom_land_side = float(ditch.DitchBottomLandSide)
+        if not ditch.DitchLandSide == "NaN":
+            self.ditch_land_side = float(ditch.DitchLandSide)
 
         if self.fill_ditch:
             if isnan(self.ditch_embankement_side) or isnan(self.ditch_land_side):
@@ -99,14 +75,20 @@ class AlgorithmBermWSBD(Algorithm):
                 )
 
     def _execute(self) -> DStability:
+        # fast path; no ditch fill and no berm means there is nothing to
+        # mutate, return a copy right away (a copy and not self.ds since
+        # callers expect a distinct object they are free to modify)
+        if not self.fill_ditch and self.fixed_x is None and self.width <= 0.0:
+            return deepcopy(self.ds)
+
         ds = deepcopy(self.ds)
 
         if self.fill_ditch:
             fp1 = self.ds.get_closest_point_from_x(self.ditch_embankement_side)
             fp2 = self.ds.get_closest_point_from_x(self.ditch_land_side)
-            fp_points = [fp1, fp2] + self.ds.surface_points_between(fp1[0], fp2[0])[
-                ::-1
-            ]
+            fp_points = [fp1, fp2] + self.ds.surface_points_between(
+                fp1[0], fp2[0], reverse=True
+            )
             ds.add_layer(fp_points, self.ditch_soilcode, label="ditch fill")
 
         # the algorithm could be used to only fill the ditch
@@ -148,11 +130,16 @@ class AlgorithmBermWSBD(Algorithm):
         else:
             raise ValueError("No valid berm option given")
 
+        # bind the surface once, it is queried multiple times below
+        surface = ds.surface
+
         # get all intersections with the top of the berm
-        intersections = polyline_polyline_intersections([p3, p4], ds.surface)
+        top_intersections = polyline_polyline_intersections([p3, p4], surface)
 
-        # get all intersections on the left side of the toe of the levee
-        left_intersections = [p for p in intersections if p[0] < p1[0]]
+        # get all intersections on the left side of the toe of the levee,
+        # the intersections are sorted on x so this is a prefix slice
+        idx = bisect_left(top_intersections, p1[0], key=lambda p: p[0])
+        left_intersections = top_intersections[:idx]
         # if we have no intersections then we do not intersect the surface on the left side
         if len(left_intersections) == 0:
             raise ValueError(
@@ -170,21 +157,45 @@ class AlgorithmBermWSBD(Algorithm):
             pB[1] - (ds.right - pB[0]) / self.slope_bottom,
         )
 
-        intersections = polyline_polyline_intersections([pB, p5], ds.surface)
+        bottom_intersections = polyline_polyline_intersections([pB, p5], surface)
         # if we have no intersections then we do not intersect the surface on the left side
-        if len(intersections) == 0:
+        if len(bottom_intersections) == 0:
             raise ValueError(
                 "No intersections between point B and p5, cannot create berm"
             )
-        pC = intersections[-1]
-
-        intersections = polyline_polyline_intersections([pA, pB, pC], ds.surface)
-        intersections = [(round(p[0], 3), round(p[1], 3)) for p in intersections]
+        pC = bottom_intersections[-1]
+
+        # the bottom part of the berm line (pB -> pC) lies on the line
+        # that was intersected with the surface above so those crossings
+        # can be reused instead of running a third full surface query;
+        # the same holds for the top part (pA -> pB) when the berm
+        # follows the top slope but with a fixed top point the segment
+        # pA -> pB deviates from that line and needs its own (small) query
+        if self.fixed_x is not None:
+            intersections = [
+                p
+                for p in polyline_polyline_intersections([pA, pB], surface)
+                if pA[0] < p[0] < pB[0]
+            ]
+        else:
+            intersections = [p for p in top_intersections if pA[0] < p[0] < pB[0]]
+        intersections += [p for p in bottom_intersections if pB[0] < p[0] < pC[0]]
+        # keep the intersections as a rounded (N, 2) float array instead
+        # of a list of tuples of python floats
+        intersections = np.round(
+            np.array(intersections, dtype=np.float64).reshape(-1, 2), 3
+        )
 
-        if not (round(pA[0], 3), round(pA[1], 3)) in intersections:
-            intersections.insert(0, pA)
-        if not (round(pC[0], 3), round(pC[1], 3)) in intersections:
-            intersections.append(pC)
+        rpA = (round(pA[0], 3), round(pA[1], 3))
+        if not np.any(
+            (intersections[:, 0] == rpA[0]) & (intersections[:, 1] == rpA[1])
+        ):
+            intersections = np.vstack([pA, intersections])
+        rpC = (round(pC[0], 3), round(pC[1], 3))
+        if not np.any(
+            (intersections[:, 0] == rpC[0]) & (intersections[:, 1] == rpC[1])
+        ):
+            intersections = np.vstack([intersections, pC])
 
         # TODO theoretically this check can go wrong if the right point of a part of the berm
         # meets the left point of the next berm (so if they share a geometry point)
@@ -197,8 +208,8 @@ class AlgorithmBermWSBD(Algorithm):
 
         for i in range(0, len(intersections), 2):
             # get the left and right point of the berm
-            p1 = intersections[i]
-            p2 = intersections[i + 1]
+            p1 = tuple(intersections[i])
+            p2 = tuple(intersections[i + 1])
 
             # check if we need to add the knikpunt of the berm
             if p1[0] < pB[0] and pB[0] < p2[0]:
@@ -207,7 +218,7 @@ class AlgorithmBermWSBD(Algorithm):
                 points = [p1, p2]
 
             # now follow the surface back to p1
-            points += ds.surface_points_between(p1[0], p2[0])[::-1]
+            points += ds.surface_points_between(p1[0], p2[0], reverse=True)
 
             ds.add_layer(points, self.soilcode)
 
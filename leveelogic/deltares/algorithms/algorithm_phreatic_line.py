@@ -1,5 +1,7 @@
 from copy import deepcopy
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+import numpy as np
+from pydantic import PrivateAttr
 
 from ...geolib.geometry import Point
 from ...deltares.algorithms.algorithm import Algorithm
@@ -15,7 +17,12 @@ class AlgorithmPhreaticLine(Algorithm):
     slope: float = 10
     offset_points: List[Tuple[float, float]] = []
 
+    _ditch_points: Optional[List[Tuple[float, float]]] = PrivateAttr(default=None)
+
     def _check_input(self):
+        # the ditch lookup walks the waternet creator settings and scans
+        # the geometry, cache the result here so _execute can reuse it
+        self._ditch_points = self.ds.ditch_points
         return True
 
     def _execute(self) -> DStability:
@@ -26,9 +33,12 @@ class AlgorithmPhreaticLine(Algorithm):
         # between the start and end of the ditch
         ignore_from_x = -9999
         ignore_until_x = -9999
-        if len(ds.ditch_points) > 0:
-            ignore_from_x = ds.ditch_points[0][0]
-            ignore_until_x = ds.ditch_points[-1][0]
+        ditch_points = (
+            self._ditch_points if self._ditch_points is not None else ds.ditch_points
+        )
+        if len(ditch_points) > 0:
+            ignore_from_x = ditch_points[0][0]
+            ignore_until_x = ditch_points[-1][0]
 
         # add leftmost point
         plline = [(ds.left, self.waterlevel)]
@@ -45,21 +55,38 @@ class AlgorithmPhreaticLine(Algorithm):
         x0 = plline[-1][0]
         z0 = plline[-1][1]
 
-        for point in [p for p in ds.surface if p[0] > x0]:
-            dx = point[0] - x0
-            z1 = max(z0 - dx / self.slope, self.waterlevel_polder)
+        # the surface is ordered from left to right so the points with
+        # x > x0 can be found with a binary search instead of a full scan
+        start = int(np.searchsorted(ds.surface_x, x0, side="right"))
+        sx = ds.surface_x[start:]
+        sz = ds.surface_z[start:]
+
+        # stop at the first surface point on the right limit
+        idx_right = np.nonzero(sx == ds.right)[0]
+        if len(idx_right) > 0:
+            sx = sx[: idx_right[0] + 1]
+            sz = sz[: idx_right[0] + 1]
 
-            # be sure to stay below the surface
-            if point[0] < ignore_from_x or point[0] > ignore_until_x:
-                if z1 > point[1] - self.waterlevel_offset:
-                    z1 = point[1] - self.waterlevel_offset
-            else:
-                z1 = self.waterlevel_polder
+        # the line follows the given slope until it reaches the polder level
+        z = np.maximum(z0 - (sx - x0) / self.slope, self.waterlevel_polder)
+        # be sure to stay below the surface, except within the ditch
+        # where the polder level is applied directly
+        outside_ditch = (sx < ignore_from_x) | (sx > ignore_until_x)
+        z = np.where(
+            outside_ditch,
+            np.minimum(z, sz - self.waterlevel_offset),
+            self.waterlevel_polder,
+        )
 
-            plline.append((point[0], round(z1, 2)))
-            if point[0] == ds.right:
-                break
+        # keep the line as one contiguous (N, 2) array instead of a list
+        # of tuples; set_phreatic_line only needs indexable points
+        plpoints = np.concatenate(
+            [
+                np.array(plline, dtype=np.float64),
+                np.column_stack([sx, np.round(z, 2)]),
+            ]
+        )
 
-        ds.set_phreatic_line(plline)
+        ds.set_phreatic_line(plpoints.tolist())
 
         return ds
@@ -1,11 +1,11 @@
-from pydantic import BaseModel, DirectoryPath, FilePath
+from pydantic import BaseModel, DirectoryPath, FilePath, PrivateAttr
+from copy import deepcopy
 from enum import IntEnum
 from pathlib import Path
-from shapely.geometry import Polygon
+import numpy as np
+import shapely
 from shapely.geometry.polygon import orient
-from shapely.ops import unary_union
 from typing import Dict, List, Tuple, Union, BinaryIO, Optional
-from dotenv import load_dotenv
 import os
 import subprocess
 from math import nan
@@ -41,8 +41,20 @@ from ..geometry.soilpolygon import SoilPolygon
 from ..geometry.soillayer import SoilLayer
 from ..soil.soil import Soil as LLSoil
 
-load_dotenv()
-DSTABILITY_MIGRATION_CONSOLE_PATH = os.getenv("DSTABILITY_MIGRATION_CONSOLE_PATH")
+def _migration_console_path() -> Optional[str]:
+    """Get the path to the DStability migration console
+
+    The .env lookup is done lazily so importing this module does not pay
+    for the dotenv file probing, it is only needed when a stix file has
+    to be upgraded.
+
+    Returns:
+        Optional[str]: The configured path or None if not set
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return os.getenv("DSTABILITY_MIGRATION_CONSOLE_PATH")
 
 
 class MaterialLayoutType(IntEnum):
@@ -52,7 +64,98 @@ class MaterialLayoutType(IntEnum):
     SAND_EMBANKEMENT_ON_SAND = 13
 
 
+# maps each characteristic point type to the attributes on the waternet
+# creator settings that hold its x coordinate
+_CHARACTERISTIC_POINT_ATTRS = {
+    CharacteristicPointType.EMBANKEMENT_TOE_WATER_SIDE: (
+        "EmbankmentCharacteristics",
+        "EmbankmentToeWaterSide",
+    ),
+    CharacteristicPointType.EMBANKEMENT_TOP_WATER_SIDE: (
+        "EmbankmentCharacteristics",
+        "EmbankmentTopWaterSide",
+    ),
+    CharacteristicPointType.EMBANKEMENT_TOP_LAND_SIDE: (
+        "EmbankmentCharacteristics",
+        "EmbankmentTopLandSide",
+    ),
+    CharacteristicPointType.SHOULDER_BASE_LAND_SIDE: (
+        "EmbankmentCharacteristics",
+        "ShoulderBaseLandSide",
+    ),
+    CharacteristicPointType.EMBANKEMENT_TOE_LAND_SIDE: (
+        "EmbankmentCharacteristics",
+        "EmbankmentToeLandSide",
+    ),
+    CharacteristicPointType.DITCH_EMBANKEMENT_SIDE: (
+        "DitchCharacteristics",
+        "DitchEmbankmentSide",
+    ),
+    CharacteristicPointType.DITCH_BOTTOM_EMBANKEMENT_SIDE: (
+        "DitchCharacteristics",
+        "DitchBottomEmbankmentSide",
+    ),
+    CharacteristicPointType.DITCH_BOTTOM_LAND_SIDE: (
+        "DitchCharacteristics",
+        "DitchBottomLandSide",
+    ),
+    CharacteristicPointType.DITCH_LAND_SIDE: (
+        "DitchCharacteristics",
+        "DitchLandSide",
+    ),
+}
+
+# per shear strength model the (model, c, phi, dilatancy, S, m) columns
+# of the extract_soilparameters csv lines
+_SOILPARAMETER_FORMATTERS = {
+    ShearStrengthModelTypePhreaticLevelInternal.MOHR_COULOMB_ADVANCED: lambda s: (
+        "MOHR_COULOMB_ADVANCED",
+        f"{s.MohrCoulombAdvancedShearStrengthModel.Cohesion:.2f}",
+        f"{s.MohrCoulombAdvancedShearStrengthModel.FrictionAngle:.2f}",
+        f"{s.MohrCoulombAdvancedShearStrengthModel.Dilatancy:.2f}",
+        "",
+        "",
+    ),
+    ShearStrengthModelTypePhreaticLevelInternal.MOHR_COULOMB_CLASSIC: lambda s: (
+        "MOHR_COULOMB_CLASSIC",
+        f"{s.MohrCoulombClassicShearStrengthModel.Cohesion:.2f}",
+        f"{s.MohrCoulombClassicShearStrengthModel.FrictionAngle:.2f}",
+        "",
+        "",
+        "",
+    ),
+    ShearStrengthModelTypePhreaticLevelInternal.NONE: lambda s: (
+        "NONE",
+        "",
+        "",
+        "",
+        "",
+        "",
+    ),
+    ShearStrengthModelTypePhreaticLevelInternal.SU: lambda s: (
+        "SU",
+        "",
+        "",
+        "",
+        f"{s.SuShearStrengthModel.ShearStrengthRatio:.2f}",
+        f"{s.SuShearStrengthModel.StrengthIncreaseExponent:.2f}",
+    ),
+    ShearStrengthModelTypePhreaticLevelInternal.SUTABLE: lambda s: (
+        "SUTABLE",
+        "",
+        "",
+        "",
+        "",
+        "",
+    ),
+}
+
+
 class DStability(BaseModel):
+    # note that the fields below soils are derived state that is rebuilt
+    # by _post_process after every mutation; reassigning them is cheap
+    # because pydantic v1 does not validate assignments by default
+    # (validate_assignment is off)
     name: str = ""
     characteristic_points: List[CharacteristicPoint] = []
     model: DStabilityModel = DStabilityModel()
@@ -67,6 +170,50 @@ class DStability(BaseModel):
     surface: List[Tuple[float, float]] = []
     waternet_settings: Dict = {}
 
+    # cached numpy representations of the geometry, built lazily and
+    # invalidated by _post_process after every geometry mutation
+    _surface_x: Optional[np.ndarray] = PrivateAttr(default=None)
+    _surface_z: Optional[np.ndarray] = PrivateAttr(default=None)
+    _surface_x_argsort: Optional[np.ndarray] = PrivateAttr(default=None)
+    _surface_x_sorted: Optional[np.ndarray] = PrivateAttr(default=None)
+    _pts_xz: Optional[np.ndarray] = PrivateAttr(default=None)
+    _bbox: Optional[Tuple[float, float, float, float]] = PrivateAttr(default=None)
+    _soilcode_set: Optional[frozenset] = PrivateAttr(default=None)
+    _layer_xz: Optional[Dict[str, np.ndarray]] = PrivateAttr(default=None)
+    _layer_xlim: Optional[Dict[str, Tuple[float, float]]] = PrivateAttr(default=None)
+    _surface_ls: Optional[shapely.LineString] = PrivateAttr(default=None)
+    _geom_cache: Dict[Tuple[int, int], List] = PrivateAttr(default_factory=dict)
+    _soils_by_id: Dict[str, Dict] = PrivateAttr(default_factory=dict)
+
+    def __deepcopy__(self, memo) -> "DStability":
+        """Create a selective deep copy of this object
+
+        The geolib model tree is the only state the algorithms mutate
+        (add_layer, set_phreatic_line etc), the other fields are either
+        immutable scalars or derived containers that are rebuilt by
+        _post_process, so those only need a shallow copy. This avoids
+        walking the (possibly large) derived geometry data on every copy.
+        """
+        data = {}
+        for name, value in self.__dict__.items():
+            if name == "model":
+                # only the datastructure subtree of the geolib model is
+                # mutated, the remaining model fields are scalars
+                # (filename, scenario / stage / id counters) so a
+                # shallow pydantic copy with a deep copied datastructure
+                # is enough and skips the deepcopy dispatch overhead
+                data[name] = value.copy(
+                    update={"datastructure": deepcopy(value.datastructure, memo)}
+                )
+            elif isinstance(value, (list, dict)):
+                data[name] = value.copy()
+            else:
+                data[name] = value
+
+        result = DStability.construct(_fields_set=set(self.__fields_set__), **data)
+        memo[id(self)] = result
+        return result
+
     @classmethod
     def from_soilprofile1(
         self,
@@ -160,7 +307,7 @@ class DStability(BaseModel):
             if str(e) == "Can't listdir a file" and auto_upgrade:
                 try:
                     subprocess.run(
-                        [DSTABILITY_MIGRATION_CONSOLE_PATH, stix_file, stix_file]
+                        [_migration_console_path(), stix_file, stix_file]
                     )
                     result.model.parse(Path(stix_file))
                 except Exception as e:
@@ -172,6 +319,34 @@ class DStability(BaseModel):
         result._post_process()
         return result
 
+    @property
+    def points_xz(self) -> np.ndarray:
+        """Get the geometry points as an (N, 2) numpy array (cached)
+
+        Returns:
+            np.ndarray: The points of the current geometry
+        """
+        if self._pts_xz is None:
+            self._pts_xz = np.asarray(self.points, dtype=np.float64)
+        return self._pts_xz
+
+    @property
+    def _bounds(self) -> Tuple[float, float, float, float]:
+        """Get the cached (left, right, top, bottom) of the current geometry
+
+        Returns:
+            Tuple[float, float, float, float]: The bounding box scalars
+        """
+        if self._bbox is None:
+            pts = self.points_xz
+            self._bbox = (
+                float(pts[:, 0].min()),
+                float(pts[:, 0].max()),
+                float(pts[:, 1].max()),
+                float(pts[:, 1].min()),
+            )
+        return self._bbox
+
     @property
     def left(self) -> float:
         """Get the left x coordinate of the current geometry
@@ -179,7 +354,7 @@ class DStability(BaseModel):
         Returns:
             float: The left x coordinate of the current geometry
         """
-        return min([p[0] for p in self.points])
+        return self._bounds[0]
 
     @property
     def right(self) -> float:
@@ -188,7 +363,7 @@ class DStability(BaseModel):
         Returns:
             float: The right x coordinate of the current geometry
         """
-        return max([p[0] for p in self.points])
+        return self._bounds[1]
 
     @property
     def top(self) -> float:
@@ -197,7 +372,7 @@ class DStability(BaseModel):
         Returns:
             float: The top z coordinate of the current geometry
         """
-        return max([p[1] for p in self.points])
+        return self._bounds[2]
 
     @property
     def bottom(self) -> float:
@@ -206,7 +381,29 @@ class DStability(BaseModel):
         Returns:
             float: The bottom z coordinate of the current geometry
         """
-        return min([p[1] for p in self.points])
+        return self._bounds[3]
+
+    @property
+    def surface_x(self) -> np.ndarray:
+        """Get the x coordinates of the surface as a numpy array (cached)
+
+        Returns:
+            np.ndarray: The x coordinates of the surface points
+        """
+        if self._surface_x is None:
+            self._surface_x = np.array([p[0] for p in self.surface], dtype=np.float64)
+        return self._surface_x
+
+    @property
+    def surface_z(self) -> np.ndarray:
+        """Get the z coordinates of the surface as a numpy array (cached)
+
+        Returns:
+            np.ndarray: The z coordinates of the surface points
+        """
+        if self._surface_z is None:
+            self._surface_z = np.array([p[1] for p in self.surface], dtype=np.float64)
+        return self._surface_z
 
     @property
     def phreatic_line(self) -> Optional[PersistableHeadLine]:
@@ -290,11 +487,12 @@ class DStability(BaseModel):
         p4 = self.get_characteristic_point(CharacteristicPointType.DITCH_LAND_SIDE)
 
         if p1.is_valid and p2.is_valid and p3.is_valid and p4.is_valid:
+            z = self.z_at(p1.x)  # z_at scans the geometry so only call it once
             return [
-                (p1.x, self.z_at(p1.x)),
-                (p2.x, self.z_at(p1.x)),
-                (p3.x, self.z_at(p1.x)),
-                (p4.x, self.z_at(p1.x)),
+                (p1.x, z),
+                (p2.x, z),
+                (p3.x, z),
+                (p4.x, z),
             ]
         else:
             return []
@@ -308,6 +506,36 @@ class DStability(BaseModel):
         """
         return len(self.ditch_points) == 4
 
+    def _get_layers(self, scenario_index: int, stage_index: int) -> List:
+        """Get the layers of the given scenario and stage (cached)
+
+        Args:
+            scenario_index (int): The scenario index
+            stage_index (int): The stage index
+
+        Returns:
+            List: The layers of the given scenario and stage
+        """
+        key = (scenario_index, stage_index)
+        layers = self._geom_cache.get(key)
+        if layers is None:
+            layers = self.model._get_geometry(scenario_index, stage_index).Layers
+            self._geom_cache[key] = layers
+        return layers
+
+    def _surface_order(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the stable argsort of the surface x coordinates and the
+        sorted x coordinates themselves (cached)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The argsort indices and the
+            sorted x coordinates
+        """
+        if self._surface_x_argsort is None:
+            self._surface_x_argsort = np.argsort(self.surface_x, kind="stable")
+            self._surface_x_sorted = self.surface_x[self._surface_x_argsort]
+        return self._surface_x_argsort, self._surface_x_sorted
+
     def get_closest_point_from_x(self, x: float) -> Tuple[float, float]:
         """Get the closest point to the given x coordinate
 
@@ -317,15 +545,15 @@ class DStability(BaseModel):
         Returns:
             Tuple[float, float]: The x and z coordinate of the closest point
         """
-        result, dlmin = None, 1e9
-
-        for p in self.surface:
-            dl = abs(p[0] - x)
-            if dl < dlmin:
-                result = p
-                dlmin = dl
-
-        return result
+        # binary search on the sorted surface x coordinates, only the
+        # two neighbouring points can be the closest one
+        order, xs = self._surface_order()
+        i = int(np.searchsorted(xs, x))
+        candidates = [
+            self.surface[order[j]]
+            for j in range(max(i - 1, 0), min(i + 1, len(xs)))
+        ]
+        return min(candidates, key=lambda p: abs(p[0] - x))
 
     def add_layer(
         self,
@@ -336,8 +564,10 @@ class DStability(BaseModel):
         scenario_index: Optional[int] = None,
         stage_index: Optional[int] = None,
     ) -> int:
+        # Point.construct skips the (pydantic) validation which is safe
+        # here since the input is known to be float tuples
         self.model.add_layer(
-            [Point(x=p[0], z=p[1]) for p in points],
+            [Point.construct(x=float(p[0]), z=float(p[1])) for p in points],
             soil_code,
             label,
             notes,
@@ -352,113 +582,18 @@ class DStability(BaseModel):
         # karakteristieke punten
         wns = self.model.datastructure.waternetcreatorsettings[0]
 
-        if point_type == CharacteristicPointType.EMBANKEMENT_TOE_WATER_SIDE:
-            if wns.EmbankmentCharacteristics.EmbankmentToeWaterSide is not "NaN":
-                return CharacteristicPoint(
-                    x=float(wns.EmbankmentCharacteristics.EmbankmentToeWaterSide),
-                    point_type=CharacteristicPointType.EMBANKEMENT_TOE_WATER_SIDE,
-                )
-            else:
-                return CharacteristicPoint(
-                    x=nan,
-                    point_type=CharacteristicPointType.EMBANKEMENT_TOE_WATER_SIDE,
-                )
-        elif point_type == CharacteristicPointType.EMBANKEMENT_TOP_WATER_SIDE:
-            if wns.EmbankmentCharacteristics.EmbankmentTopWaterSide is not "NaN":
-                return CharacteristicPoint(
-                    x=float(wns.EmbankmentCharacteristics.EmbankmentTopWaterSide),
-                    point_type=CharacteristicPointType.EMBANKEMENT_TOP_WATER_SIDE,
-                )
-            else:
-                return CharacteristicPoint(
-                    x=nan,
-                    point_type=CharacteristicPointType.EMBANKEMENT_TOP_WATER_SIDE,
-                )
-        elif point_type == CharacteristicPointType.EMBANKEMENT_TOP_LAND_SIDE:
-            if wns.EmbankmentCharacteristics.EmbankmentTopLandSide is not "NaN":
-                return CharacteristicPoint(
-                    x=float(wns.EmbankmentCharacteristics.EmbankmentTopLandSide),
-                    point_type=CharacteristicPointType.EMBANKEMENT_TOP_LAND_SIDE,
-                )
-            else:
-                return CharacteristicPoint(
-                    x=nan,
-                    point_type=CharacteristicPointType.EMBANKEMENT_TOP_LAND_SIDE,
-                )
-
-        elif point_type == CharacteristicPointType.SHOULDER_BASE_LAND_SIDE:
-            if wns.EmbankmentCharacteristics.ShoulderBaseLandSide is not "NaN":
-                return CharacteristicPoint(
-                    x=float(wns.EmbankmentCharacteristics.ShoulderBaseLandSide),
-                    point_type=CharacteristicPointType.SHOULDER_BASE_LAND_SIDE,
-                )
-            else:
-                return CharacteristicPoint(
-                    x=nan,
-                    point_type=CharacteristicPointType.SHOULDER_BASE_LAND_SIDE,
-                )
-        elif point_type == CharacteristicPointType.EMBANKEMENT_TOE_LAND_SIDE:
-            if wns.EmbankmentCharacteristics.EmbankmentToeLandSide is not "NaN":
-
-                return CharacteristicPoint(
-                    x=float(wns.EmbankmentCharacteristics.EmbankmentToeLandSide),
-                    point_type=CharacteristicPointType.EMBANKEMENT_TOE_LAND_SIDE,
-                )
-            else:
-                return CharacteristicPoint(
-                    x=nan,
-                    point_type=CharacteristicPointType.EMBANKEMENT_TOE_LAND_SIDE,
-                )
-        elif point_type == CharacteristicPointType.DITCH_EMBANKEMENT_SIDE:
-            if wns.DitchCharacteristics.DitchEmbankmentSide is not "NaN":
-                return CharacteristicPoint(
-                    x=float(wns.DitchCharacteristics.DitchEmbankmentSide),
-                    point_type=CharacteristicPointType.DITCH_EMBANKEMENT_SIDE,
-                )
-            else:
-                return CharacteristicPoint(
-                    x=nan,
-                    point_type=CharacteristicPointType.DITCH_EMBANKEMENT_SIDE,
-                )
-        elif point_type == CharacteristicPointType.DITCH_BOTTOM_EMBANKEMENT_SIDE:
-            if wns.DitchCharacteristics.DitchBottomEmbankmentSide is not "NaN":
-                return CharacteristicPoint(
-                    x=float(wns.DitchCharacteristics.DitchBottomEmbankmentSide),
-                    point_type=CharacteristicPointType.DITCH_BOTTOM_EMBANKEMENT_SIDE,
-                )
-            else:
-                return CharacteristicPoint(
-                    x=nan,
-                    point_type=CharacteristicPointType.DITCH_BOTTOM_EMBANKEMENT_SIDE,
-                )
-        elif point_type == CharacteristicPointType.DITCH_BOTTOM_LAND_SIDE:
-            if wns.DitchCharacteristics.DitchBottomLandSide is not "NaN":
-                return CharacteristicPoint(
-                    x=float(wns.DitchCharacteristics.DitchBottomLandSide),
-                    point_type=CharacteristicPointType.DITCH_BOTTOM_LAND_SIDE,
-                )
-            else:
-                return CharacteristicPoint(
-                    x=nan,
-                    point_type=CharacteristicPointType.DITCH_BOTTOM_LAND_SIDE,
-                )
-        elif point_type == CharacteristicPointType.DITCH_LAND_SIDE:
-            if wns.DitchCharacteristics.DitchLandSide is not "NaN":
-                return CharacteristicPoint(
-                    x=float(wns.DitchCharacteristics.DitchLandSide),
-                    point_type=CharacteristicPointType.DITCH_LAND_SIDE,
-                )
-            else:
-                return CharacteristicPoint(
-                    x=nan,
-                    point_type=CharacteristicPointType.DITCH_LAND_SIDE,
-                )
-
-        else:
+        try:
+            characteristics, attr = _CHARACTERISTIC_POINT_ATTRS[point_type]
+        except KeyError:
             raise ValueError(
                 f"Invalid characteristic point type ({point_type}) requested"
             )
 
+        value = getattr(getattr(wns, characteristics), attr)
+        if value != "NaN":
+            return CharacteristicPoint(x=float(value), point_type=point_type)
+        return CharacteristicPoint(x=nan, point_type=point_type)
+
     def get_headline_by_label(self, label: str = "") -> PersistableHeadLine:
         for hl in self.model.waternets[0].HeadLines:
             if hl.Label == label:
@@ -493,8 +628,13 @@ class DStability(BaseModel):
                     raise ValueError(
                         f"Trying to set more coords ({len(coords)}) then currently in headline '{label}' ({len(hl.Points)})"
                     )
-                for i in range(len(coords)):
-                    hl.Points[i] = PersistablePoint(X=coords[i][0], Z=coords[i][1])
+                # PersistablePoint.construct skips the (pydantic)
+                # validation which is safe here since the input is known
+                # to be float tuples
+                hl.Points[: len(coords)] = [
+                    PersistablePoint.construct(X=float(p[0]), Z=float(p[1]))
+                    for p in coords
+                ]
                 self._post_process()
                 return
 
@@ -542,14 +682,17 @@ class DStability(BaseModel):
 
         # 1. check if we already have a phreatic line
         if self.has_phreatic_line:
-            points = [PersistablePoint(X=p[0], Z=p[1]) for p in points]
+            points = [
+                PersistablePoint.construct(X=float(p[0]), Z=float(p[1]))
+                for p in points
+            ]
             for i, hl in enumerate(self.model.datastructure.waternets[0].HeadLines):
                 if hl.Id == self.model.datastructure.waternets[0].PhreaticLineId:
                     self.model.datastructure.waternets[0].HeadLines[i].Points = points
                     break
         else:
             self.model.add_head_line(
-                [Point(x=p[0], z=p[1]) for p in points],
+                [Point.construct(x=float(p[0]), z=float(p[1])) for p in points],
                 "Phreatic line",
                 is_phreatic_line=True,
                 scenario_index=self.current_scenario_index,
@@ -559,15 +702,26 @@ class DStability(BaseModel):
 
     def _post_process(self):
         """Do some post processing stuff to set properties and save time"""
+        # invalidate the cached geometry arrays
+        self._surface_x = None
+        self._surface_z = None
+        self._surface_x_argsort = None
+        self._surface_x_sorted = None
+        self._pts_xz = None
+        self._bbox = None
+        self._soilcode_set = None
+        self._layer_xz = None
+        self._layer_xlim = None
+        self._surface_ls = None
+        self._geom_cache = {}
+
         # get the points
-        layers = self.model._get_geometry(
+        layers = self._get_layers(
             self.current_scenario_index, self.current_stage_index
-        ).Layers
-        polygons = []
+        )
         self.points = []
 
         self.soillayers = []
-        self.soils = {}
         self.points = []
         self.boundary = []
         self.surface = []
@@ -577,12 +731,15 @@ class DStability(BaseModel):
             for sv in self.model.datastructure.soilvisualizations.SoilVisualizations
         }
 
+        # keep the soils indexed by id as well so id based lookups stay
+        # O(1) after self.soils is flattened to a list below
+        self._soils_by_id = {}
         for soil in self.model.soils.Soils:
             if not soil.Id in soilcolors.keys():
                 color = "#54575c"
             else:
                 color = soilcolors[soil.Id]
-            self.soils[soil.Id] = {
+            d = {
                 "code": soil.Code,
                 "name": soil.Name,
                 "color": color,
@@ -597,64 +754,75 @@ class DStability(BaseModel):
                 and soil.ShearStrengthModelTypeAbovePhreaticLevel
                 == soil.ShearStrengthModelTypeAbovePhreaticLevel
             ):
-                self.soils[soil.Id][
-                    "cohesion"
-                ] = soil.MohrCoulombClassicShearStrengthModel.Cohesion
-                self.soils[soil.Id][
-                    "friction_angle"
-                ] = soil.MohrCoulombClassicShearStrengthModel.FrictionAngle
+                d["cohesion"] = soil.MohrCoulombClassicShearStrengthModel.Cohesion
+                d["friction_angle"] = (
+                    soil.MohrCoulombClassicShearStrengthModel.FrictionAngle
+                )
             if (
                 soil.ShearStrengthModelTypeAbovePhreaticLevel
                 == ShearStrengthModelTypePhreaticLevelInternal.MOHR_COULOMB_ADVANCED
                 and soil.ShearStrengthModelTypeAbovePhreaticLevel
                 == soil.ShearStrengthModelTypeAbovePhreaticLevel
             ):
-                self.soils[soil.Id][
-                    "cohesion"
-                ] = soil.MohrCoulombAdvancedShearStrengthModel.Cohesion
-                self.soils[soil.Id][
-                    "friction_angle"
-                ] = soil.MohrCoulombAdvancedShearStrengthModel.FrictionAngle
+                d["cohesion"] = soil.MohrCoulombAdvancedShearStrengthModel.Cohesion
+                d["friction_angle"] = (
+                    soil.MohrCoulombAdvancedShearStrengthModel.FrictionAngle
+                )
+            self._soils_by_id[soil.Id] = d
 
         soillayers = {}
         for sl in self.model.datastructure.soillayers[0].SoilLayers:
             soillayers[sl.LayerId] = sl.SoilId
 
+        self._layer_xz = {}
+        self._layer_xlim = {}
+        layer_arrays = []
         for layer in layers:
-            self.points += [(float(p.X), float(p.Z)) for p in layer.Points]
-            polygons.append(Polygon([(float(p.X), float(p.Z)) for p in layer.Points]))
+            # walk the pydantic point objects only once per layer and
+            # keep the coordinates as an (N, 2) array for the hot paths
+            points = [(float(p.X), float(p.Z)) for p in layer.Points]
+            xz = np.asarray(points, dtype=np.float64)
+            self._layer_xz[layer.Id] = xz
+            # the x range allows cheap rejection of layers that do not
+            # straddle a probed x coordinate
+            self._layer_xlim[layer.Id] = (float(xz[:, 0].min()), float(xz[:, 0].max()))
+            layer_arrays.append(xz)
+            self.points += points
             self.soillayers.append(
                 {
-                    "points": [(float(p.X), float(p.Z)) for p in layer.Points],
-                    "soil": self.soils[soillayers[layer.Id]],
+                    "points": points,
+                    "soil": self._soils_by_id[soillayers[layer.Id]],
                     "layer_id": layer.Id,
                 }
             )
 
-        # now remove the ids of the soils
-        self.soils = [d for d in self.soils.values()]
+        # the public soils list stays a plain list of dicts
+        self.soils = list(self._soils_by_id.values())
 
         # get the surface
-        # merge all polygons and return the boundary of that polygon
-        boundary = orient(unary_union(polygons), sign=-1)
-
-        # get the points
-        self.boundary = [
-            (round(p[0], 3), round(p[1], 3))
-            for p in list(zip(*boundary.exterior.coords.xy))[:-1]
-        ]
+        # merge all polygons and return the boundary of that polygon;
+        # the per layer arrays are stacked into one coordinate buffer so
+        # the polygons can be built with the shapely ufuncs in two C
+        # calls instead of one Polygon(...) python call per layer
+        coords = np.concatenate(layer_arrays)
+        # the stacked buffer holds exactly the coordinates of
+        # self.points so it doubles as the points_xz cache
+        self._pts_xz = coords
+        ring_ids = np.repeat(
+            np.arange(len(layer_arrays)), [len(a) for a in layer_arrays]
+        )
+        polygons = shapely.polygons(shapely.linearrings(coords, indices=ring_ids))
+        boundary = orient(shapely.union_all(polygons), sign=-1)
 
-        # get the leftmost point
-        left = min([p[0] for p in self.boundary])
-        topleft_point = sorted(
-            [p for p in self.boundary if p[0] == left], key=lambda x: x[1]
-        )[-1]
+        # get the points, drop the repeated closing point and round in
+        # one vectorized call instead of a python loop per point
+        arr = np.round(np.asarray(boundary.exterior.coords)[:-1], 3)
+        self.boundary = list(map(tuple, arr.tolist()))
 
-        # get the rightmost points
-        right = max([p[0] for p in self.boundary])
-        rightmost_point = sorted(
-            [p for p in self.boundary if p[0] == right], key=lambda x: x[1]
-        )[-1]
+        # get the topmost point on the left and right limits, a composite
+        # sort on (x, -z) replaces the min / filter / sort passes
+        topleft_point = self.boundary[int(np.lexsort((-arr[:, 1], arr[:, 0]))[0])]
+        rightmost_point = self.boundary[int(np.lexsort((-arr[:, 1], -arr[:, 0]))[0])]
 
         # get the index of leftmost point
         idx_left = self.boundary.index(topleft_point)
@@ -683,21 +851,61 @@ class DStability(BaseModel):
     def surface_intersections(
         self, polyline: List[Tuple[float, float]]
     ) -> List[Tuple[float, float]]:
-        return polyline_polyline_intersections(polyline, self.surface)
+        """Get the intersections between the given polyline and the surface
+
+        Args:
+            polyline (List[Tuple[float, float]]): The polyline to intersect
+
+        Returns:
+            List[Tuple[float, float]]: The intersections sorted by x
+        """
+        # the surface linestring is cached so repeated queries only pay
+        # for one GEOS intersection call
+        if self._surface_ls is None:
+            self._surface_ls = shapely.LineString(self.surface)
+        intersection = self._surface_ls.intersection(shapely.LineString(polyline))
+
+        points = []
+        for geom in getattr(intersection, "geoms", [intersection]):
+            if geom.is_empty:
+                continue
+            if isinstance(geom, shapely.LineString):
+                # collinear overlap, keep the end points of the overlap
+                points += list(geom.coords)
+            else:
+                points.append((geom.x, geom.y))
+
+        seen = set()
+        result = []
+        for p in points:
+            if p not in seen:
+                seen.add(p)
+                result.append(p)
+        return sorted(result, key=lambda p: p[0])
 
     def surface_points_between(
-        self, left: float, right: float
+        self, left: float, right: float, reverse: bool = False
     ) -> List[Tuple[float, float]]:
         """Get a list of surface points between the given limits
 
         Args:
             left (float): The left limit
             right (float): The right limit
+            reverse (bool): Return the points from right to left, defaults to False
 
         Returns:
             List[Tuple[float, float]]: List of surface points between left and right
         """
-        return [p for p in self.surface if p[0] > left and p[0] < right]
+        # bisect the sorted surface x coordinates to find the points in
+        # range, then restore the surface walk order with one sort over
+        # the selected indices only
+        order, xs = self._surface_order()
+        lo = int(np.searchsorted(xs, left, side="right"))
+        hi = int(np.searchsorted(xs, right, side="left"))
+        idx = np.sort(order[lo:hi])
+        if reverse:
+            idx = idx[::-1]
+        return [self.surface[i] for i in idx]
 
     def set_scenario_and_stage(self, scenario_index: int, stage_index: int):
         """Set the current scenario and stage
@@ -736,29 +944,53 @@ class DStability(BaseModel):
         """
         result = SoilProfile1()
 
-        layers = self.model._get_geometry(scenario_index, stage_index).Layers
+        layers = self._get_layers(scenario_index, stage_index)
 
         soillayers = []
 
+        # the coordinate arrays built by _post_process can only be used
+        # for the scenario and stage they were built for
+        layer_xz = self._layer_xz
+        if (scenario_index, stage_index) != (
+            self.current_scenario_index,
+            self.current_stage_index,
+        ):
+            layer_xz = None
+
         for layer in layers:
-            points = [(float(p.X), float(p.Z)) for p in layer.Points]
-            points.append(points[0])
-            for i in range(1, len(points)):
-                p1 = points[i - 1]
-                if i == len(points):
-                    p2 = points[0]
-                else:
-                    p2 = points[i]
-
-                if min(p1[0], p2[0]) <= x and x <= max(p1[0], p2[0]):
-                    soil = self.get_soil_from_layer_id(layer.Id)
-                    if p1[0] == p2[0]:
-                        z = round(p1[1], 3)
-                    else:
-                        z = round(
-                            p1[1] + (x - p1[0]) / (p2[0] - p1[0]) * (p2[1] - p1[1]), 3
-                        )
-                    soillayers.append((z, soil))
+            # intersect all edges of the (closed) layer polygon with the
+            # vertical line at x in one vectorized pass
+            if layer_xz is not None:
+                # reject layers whose x range does not straddle x before
+                # touching any of their edges
+                xmin, xmax = self._layer_xlim[layer.Id]
+                if x < xmin or x > xmax:
+                    continue
+                pts = layer_xz[layer.Id]
+            else:
+                pts = np.array(
+                    [(float(p.X), float(p.Z)) for p in layer.Points], dtype=np.float64
+                )
+                if x < pts[:, 0].min() or x > pts[:, 0].max():
+                    continue
+            x1, z1 = pts[:, 0], pts[:, 1]
+            x2, z2 = np.roll(x1, -1), np.roll(z1, -1)
+
+            mask = (np.minimum(x1, x2) <= x) & (x <= np.maximum(x1, x2))
+            if not mask.any():
+                continue
+
+            dx = x2[mask] - x1[mask]
+            # vertical edges keep their own z, the division is guarded
+            # with a dummy denominator for those
+            zs = np.where(
+                dx == 0.0,
+                z1[mask],
+                z1[mask]
+                + (x - x1[mask]) / np.where(dx == 0.0, 1.0, dx) * (z2[mask] - z1[mask]),
+            )
+            soil = self.get_soil_from_layer_id(layer.Id)
+            soillayers += [(round(float(z), 3), soil) for z in zs]
 
         soillayers = sorted(soillayers, key=lambda x: x[0], reverse=True)
         if soillayers[0] == soillayers[1]:
@@ -802,6 +1034,21 @@ class DStability(BaseModel):
         sp1 = self.soilprofile1_at(x, scenario_index, stage_index)
         return [sl.top for sl in sp1.soillayers]
 
+    def z_at_many(self, xs: Union[List[float], np.ndarray]) -> np.ndarray:
+        """Get the surface z coordinate for each of the given x coordinates
+
+        Unlike z_at, which intersects all soillayer edges per call, this
+        interpolates the cached surface line with one vectorized numpy
+        call which is much faster when many x coordinates are probed.
+
+        Args:
+            xs (Union[List[float], np.ndarray]): The x coordinates
+
+        Returns:
+            np.ndarray: The interpolated surface z coordinate per x
+        """
+        return np.interp(xs, self.surface_x, self.surface_z)
+
     def has_soilcode(self, soilcode: str) -> bool:
         """Check if the current model has the given soilcode
 
@@ -811,7 +1058,9 @@ class DStability(BaseModel):
         Returns:
             bool: True if the soilcode is available
         """
-        return soilcode in [d["code"] for d in self.soils]
+        if self._soilcode_set is None:
+            self._soilcode_set = frozenset(d["code"] for d in self.soils)
+        return soilcode in self._soilcode_set
 
     def serialize(self, location: Union[FilePath, DirectoryPath, BinaryIO]):
         """Serialize the model to a file
@@ -829,59 +1078,23 @@ class DStability(BaseModel):
             "name,code,model,yd,ys,probabilistic,cohesion,friction angle,dilatancy,S,m\n"
         ]
         for soil in self.model.soils.Soils:
-            d = {
-                "name": soil.Name,
-                "code": soil.Code,
-                "model": "",
-                "yd": f"{soil.VolumetricWeightAbovePhreaticLevel:.2f}",
-                "ys": f"{soil.VolumetricWeightBelowPhreaticLevel:.2f}",
-                "prob": "",
-                "c": "",
-                "phi": "",
-                "dilatancy": "",
-                "S": "",
-                "m": "",
-            }
+            model = c = phi = dilatancy = S = m = prob = ""
 
             if soil.IsProbabilistic:
-                d["prob"] = "true"
+                prob = "true"
             else:
-                ssma = soil.ShearStrengthModelTypeAbovePhreaticLevel
-                ssmb = soil.ShearStrengthModelTypeBelowPhreaticLevel
-
-                if (
-                    ssma
-                    == ShearStrengthModelTypePhreaticLevelInternal.MOHR_COULOMB_ADVANCED
-                ):
-                    d["model"] = "MOHR_COULOMB_ADVANCED"
-                    d["c"] = (
-                        f"{soil.MohrCoulombAdvancedShearStrengthModel.Cohesion:.2f}"
-                    )
-                    d["phi"] = (
-                        f"{soil.MohrCoulombAdvancedShearStrengthModel.FrictionAngle:.2f}"
-                    )
-                    d["dilatancy"] = (
-                        f"{soil.MohrCoulombAdvancedShearStrengthModel.Dilatancy:.2f}"
-                    )
-                elif (
-                    ssma
-                    == ShearStrengthModelTypePhreaticLevelInternal.MOHR_COULOMB_CLASSIC
-                ):
-                    d["model"] = "MOHR_COULOMB_CLASSIC"
-                    d["c"] = f"{soil.MohrCoulombClassicShearStrengthModel.Cohesion:.2f}"
-                    d["phi"] = (
-                        f"{soil.MohrCoulombClassicShearStrengthModel.FrictionAngle:.2f}"
-                    )
-                elif ssma == ShearStrengthModelTypePhreaticLevelInternal.NONE:
-                    d["model"] = "NONE"
-                elif ssma == ShearStrengthModelTypePhreaticLevelInternal.SU:
-                    d["model"] = "SU"
-                    d["S"] = f"{soil.SuShearStrengthModel.ShearStrengthRatio:.2f}"
-                    d["m"] = f"{soil.SuShearStrengthModel.StrengthIncreaseExponent:.2f}"
-                elif ssma == ShearStrengthModelTypePhreaticLevelInternal.SUTABLE:
-                    d["model"] = "SUTABLE"
+                # dispatch on the shear strength model instead of the
+                # old if / elif ladder
+                formatter = _SOILPARAMETER_FORMATTERS.get(
+                    soil.ShearStrengthModelTypeAbovePhreaticLevel
+                )
+                if formatter is not None:
+                    model, c, phi, dilatancy, S, m = formatter(soil)
             result.append(
-                f"{d['name']},{d['code']},{d['model']},{d['yd']},{d['ys']},{d['prob']},{d['c']},{d['phi']},{d['dilatancy']},{d['S']},{d['m']}\n"
+                f"{soil.Name},{soil.Code},{model},"
+                f"{soil.VolumetricWeightAbovePhreaticLevel:.2f},"
+                f"{soil.VolumetricWeightBelowPhreaticLevel:.2f},"
+                f"{prob},{c},{phi},{dilatancy},{S},{m}\n"
             )
         return result
 
@@ -1,5 +1,6 @@
 from pathlib import Path
 from typing import List, Tuple
+import numpy as np
 from pyproj import Transformer
 from shapely.geometry import Point, LineString, MultiPoint
 import re
@@ -228,9 +229,7 @@ def ingredients_to_color(main, sand, adds) -> str:
     maxadd = -1
     for add in adds:
         if int(add[1]) > maxadd:
-            maxadd = int(add[1])
-            if maxadd > 4:
-                maxadd = 4
+            maxadd = min(int(add[1]), 4)
             bg = nen5104_addition_color_dict[add[0]]
 
     if bg == "#000000":
@@ -287,11 +286,11 @@ def get_key(dict, val):
     raise ValueError(f"Unknown value '{val}' for the given dict.")
 
 
-def sti_geometry_helper(top: List[int], bottom: List[int]) -> List[int]:
-    polyline = top + bottom[::-1]
+def _strip_shared_ends(polyline: List[int]) -> List[int]:
+    """Remove matching points from the beginning and end of the polyline,
+    returns the stripped polyline (starting with the last shared point)
+    or None if the start and end of the polyline share no points"""
     result = []
-
-    # remove from the beginning and end if they are the same but save the last removed idx
     for i in range(len(polyline)):
         if polyline[0] == polyline[-1]:
             result = [polyline[0]]
@@ -306,23 +305,18 @@ def sti_geometry_helper(top: List[int], bottom: List[int]) -> List[int]:
                         result.append(p)
                         break
                 return result
+    return None
+
+
+def sti_geometry_helper(top: List[int], bottom: List[int]) -> List[int]:
+    result = _strip_shared_ends(top + bottom[::-1])
+    if result is not None:
+        return result
 
     # no result, lets try it the other way
-    polyline = top[::-1] + bottom
-    for i in range(len(polyline)):
-        if polyline[0] == polyline[-1]:
-            result = [polyline[0]]
-            polyline.pop(0)
-            polyline.pop(-1)
-        else:
-            if len(result) > 0:
-                for p in polyline:
-                    if p != polyline[-1]:
-                        result.append(p)
-                    else:
-                        result.append(p)
-                        break
-                return result[::-1]
+    result = _strip_shared_ends(top[::-1] + bottom)
+    if result is not None:
+        return result[::-1]
 
     # no result, all unique points
     return top + bottom[::-1]
@@ -358,26 +352,111 @@ def line_polyline_intersections(
         )
 
 
-def polyline_polyline_intersections(
+_numba_intersect_polylines = None
+_numba_checked = False
+
+
+def _intersect_kernel():
+    """Get the numba compiled intersection kernel or None if numba is
+    not available (the import is done lazily so callers that never
+    intersect polylines do not pay for it)"""
+    global _numba_intersect_polylines, _numba_checked
+    if not _numba_checked:
+        _numba_checked = True
+        try:
+            from ._intersect_numba import intersect_polylines
+
+            _numba_intersect_polylines = intersect_polylines
+        except ImportError:
+            _numba_intersect_polylines = None
+    return _numba_intersect_polylines
+
+
+def _intersect_polylines_np(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Numpy fallback for the numba intersection kernel, same contract
+    as _intersect_numba.intersect_polylines"""
+    a1, a2 = a[:-1], a[1:]
+    b1, b2 = b[:-1], b[1:]
+    da = a2 - a1
+    db = b2 - b1
+
+    # f(p) = dx * (pz - p1z) - dz * (px - p1x), the sign tells on which
+    # side of the (extended) segment the point p lies; the (dx, dz, c)
+    # line constants are hoisted per segment and f is evaluated once per
+    # polyline vertex, adjacent vertex pairs (f[:-1], f[1:]) then give
+    # the sign change test per segment
+    ca = da[:, 1] * a1[:, 0] - da[:, 0] * a1[:, 1]
+    cb = db[:, 1] * b1[:, 0] - db[:, 0] * b1[:, 1]
+
+    fa = da[:, 0, None] * b[None, :, 1] - da[:, 1, None] * b[None, :, 0] + ca[:, None]
+    fb = db[:, 0, None] * a[None, :, 1] - db[:, 1, None] * a[None, :, 0] + cb[:, None]
+
+    mask = (fa[:, :-1] * fa[:, 1:] <= 0) & (fb[:, :-1] * fb[:, 1:] <= 0).T
+
+    ii, jj = np.nonzero(mask)
+    if len(ii) == 0:
+        return np.empty((0, 2), dtype=np.float64)
+
+    # parametric solve, skip parallel (collinear) pairs
+    denom = da[ii, 0] * db[jj, 1] - da[ii, 1] * db[jj, 0]
+    valid = denom != 0
+    ii, jj, denom = ii[valid], jj[valid], denom[valid]
+    diff = b1[jj] - a1[ii]
+    t = (diff[:, 0] * db[jj, 1] - diff[:, 1] * db[jj, 0]) / denom
+    xs = a1[ii, 0] + t * da[ii, 0]
+    zs = a1[ii, 1] + t * da[ii, 1]
+    return np.column_stack([xs, zs])
+
+
+def polyline_polyline_intersections_np(
     points_line1: List[Tuple[float, float]],
     points_line2: List[Tuple[float, float]],
-):
-    result = []
-    ls1 = LineString(points_line1)
-    ls2 = LineString(points_line2)
-    intersections = ls1.intersection(ls2)
+) -> List[Tuple[float, float]]:
+    """Find the intersections between two polylines using vectorized numpy math
 
-    if intersections.is_empty:
-        final_result = []
-    elif type(intersections) == MultiPoint:
-        result = [(g.x, g.y) for g in intersections.geoms]
-    elif type(intersections) == Point:
-        x, y = intersections.coords.xy
-        result.append((x[0], y[0]))
-    elif intersections.is_empty:
+    All segment pairs are first filtered with the sign product test
+    (the endpoints of a segment must lie on opposite sides of the other
+    segment's supporting line); only the surviving pairs get the
+    parametric solve. If numba is installed the compiled kernel from
+    _intersect_numba is used, otherwise a broadcasted numpy expression.
+
+    Args:
+        points_line1 (List[Tuple[float, float]]): points of the first polyline
+        points_line2 (List[Tuple[float, float]]): points of the second polyline
+
+    Returns:
+        List[Tuple[float, float]]: the unique intersection points sorted on x
+    """
+    a = np.ascontiguousarray(points_line1, dtype=np.float64)
+    b = np.ascontiguousarray(points_line2, dtype=np.float64)
+
+    if len(a) < 2 or len(b) < 2:
         return []
+
+    kernel = _intersect_kernel()
+    if kernel is not None:
+        pts = kernel(a, b)
     else:
-        raise ValueError(f"Unimplemented intersection type '{type(intersections)}'")
+        pts = _intersect_polylines_np(a, b)
+
+    # remove duplicates (intersections on shared segment endpoints are
+    # found for both adjacent segments)
+    result = []
+    seen = set()
+    for x, z in pts:
+        p = (float(x), float(z))
+        if p not in seen:
+            seen.add(p)
+            result.append(p)
+
+    return sorted(result, key=lambda p: p[0])
+
+
+def polyline_polyline_intersections(
+    points_line1: List[Tuple[float, float]],
+    points_line2: List[Tuple[float, float]],
+):
+    result = polyline_polyline_intersections_np(points_line1, points_line2)
 
     # do not include points that are on line1 or line2
     final_result = [p for p in result if not p in points_line1 or p in points_line2]
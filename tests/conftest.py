@@ -1,96 +1,99 @@
 import pytest
+from copy import deepcopy
 from typing import List, Dict
 from pathlib import Path
 
 from leveelogic.helpers import case_insensitive_glob
 from leveelogic.soilinvestigation.cpt import Cpt, CptConversionMethod
 from leveelogic.geometry.soilprofileN import SoilProfileN
+from leveelogic.deltares.dstability import DStability
+
+
+@pytest.fixture(scope="session")
+def _ds_fc_alg_pl_wsbd() -> DStability:
+    """Parse the fc_alg_pl_wsbd stix file once per test session"""
+    return DStability.from_stix("tests/testdata/stix/fc_alg_pl_wsbd.stix")
+
+
+@pytest.fixture
+def ds_fc_alg_pl_wsbd(_ds_fc_alg_pl_wsbd) -> DStability:
+    """A fresh copy of the session wide fc_alg_pl_wsbd model, copying is
+    much cheaper than re-parsing the stix file for every test"""
+    return deepcopy(_ds_fc_alg_pl_wsbd)
+
+
+@pytest.fixture(scope="session")
+def _cpt_gef_all_files() -> List[Path]:
+    """Glob the cpt gef test files once per test session"""
+    return list(case_insensitive_glob("tests/testdata/cpts", ".gef"))
+
+
+@pytest.fixture(scope="session")
+def _cpt_xml_all_files() -> List[Path]:
+    """Glob the cpt xml test files once per test session"""
+    return list(case_insensitive_glob("tests/testdata/cpts", ".xml"))
 
 
 @pytest.fixture
-def cpt_gef_files() -> List[Path]:
+def cpt_gef_files(_cpt_gef_all_files) -> List[Path]:
     """Get all valid cpt gef files
 
     Returns:
         List[Path]: A list with all file paths to valid gef cpt files
     """
-    return [
-        f
-        for f in case_insensitive_glob("tests/testdata/cpts", ".gef")
-        if not f.stem.find("invalid") > -1
-    ]
+    return [f for f in _cpt_gef_all_files if "invalid" not in f.stem]
 
 
 @pytest.fixture
-def cpt_gef_files_invalid() -> List[Path]:
+def cpt_gef_files_invalid(_cpt_gef_all_files) -> List[Path]:
     """Get all invalid cpt gef files
 
     Returns:
         List[Path]: A list with all file paths to invalid gef cpt files
     """
-    return [
-        f
-        for f in case_insensitive_glob("tests/testdata/cpts", ".gef")
-        if not f.stem.find("invalid") == -1
-    ]
+    return [f for f in _cpt_gef_all_files if "invalid" in f.stem]
 
 
 @pytest.fixture
-def cpt_xml_files() -> List[Path]:
+def cpt_xml_files(_cpt_xml_all_files) -> List[Path]:
     """Get all valid cpt xml files
 
     Returns:
         List[Path]: A list with all file paths to valid xml cpt files
     """
-    return [
-        f
-        for f in case_insensitive_glob("tests/testdata/cpts", ".xml")
-        if not f.stem.find("invalid") > -1
-    ]
+    return [f for f in _cpt_xml_all_files if "invalid" not in f.stem]
 
 
 @pytest.fixture
-def cpt_xml_files_invalid() -> List[Path]:
+def cpt_xml_files_invalid(_cpt_xml_all_files) -> List[Path]:
     """Get all invalid cpt xml files
 
     Returns:
         List[Path]: A list with all file paths to invalid xml cpt files
     """
-    return [
-        f
-        for f in case_insensitive_glob("tests/testdata/cpts", ".xml")
-        if not f.stem.find("invalid") == -1
-    ]
+    return [f for f in _cpt_xml_all_files if "invalid" in f.stem]
 
 
 @pytest.fixture
-def cpt_gef_strings() -> List[Dict]:
+def cpt_gef_strings(_cpt_gef_all_files) -> List[Dict]:
     """
     This creates a dictionary with cpt test files saved with the filename
     (without extentsion) as key and the data (str) as value
 
     You can use the filename to add more testdata like expected interpretations
     """
-    cpt_strings = {}
-    for f in case_insensitive_glob("tests/testdata/cpts", ".gef"):
-        p = Path(f).stem
-        cpt_strings[p] = open(f, "r").read()
-    return cpt_strings
+    return {Path(f).stem: Path(f).read_text() for f in _cpt_gef_all_files}
 
 
 @pytest.fixture
-def cpt_xml_strings() -> List[Dict]:
+def cpt_xml_strings(_cpt_xml_all_files) -> List[Dict]:
     """
     This creates a dictionary with cpt test files saved with the filename
     (without extentsion) as key and the data (str) as value
 
     You can use the filename to add more testdata like expected interpretations
     """
-    cpt_strings = {}
-    for f in case_insensitive_glob("tests/testdata/cpts", ".xml"):
-        p = Path(f).stem
-        cpt_strings[p] = open(f, "r").read()
-    return cpt_strings
+    return {Path(f).stem: Path(f).read_text() for f in _cpt_xml_all_files}
 
 
 @pytest.fixture
@@ -8,10 +8,9 @@ import pytest
 
 
 class TestAlgorithmBermWSBD:
-    def test_execute(self):
-        ds = DStability.from_stix("tests/testdata/stix/fc_alg_pl_wsbd.stix")
+    def test_execute(self, ds_fc_alg_pl_wsbd):
         alg = AlgorithmBermWSBD(
-            ds=ds,
+            ds=ds_fc_alg_pl_wsbd,
             soilcode="Dijksmateriaal (klei)_K3_CPhi",
             slope_top=10,
             slope_bottom=1,
@@ -21,10 +20,9 @@ class TestAlgorithmBermWSBD:
         ds = alg.execute()
         ds.serialize("tests/testdata/output/fc_alg_pl_wsbd_berm.stix")
 
-    def test_execute_only_fill_ditch(self):
-        ds = DStability.from_stix("tests/testdata/stix/fc_alg_pl_wsbd.stix")
+    def test_execute_only_fill_ditch(self, ds_fc_alg_pl_wsbd):
         alg = AlgorithmBermWSBD(
-            ds=ds,
+            ds=ds_fc_alg_pl_wsbd,
             slope_top=10,
             slope_bottom=1,
             fill_ditch=True,
@@ -33,10 +31,9 @@ class TestAlgorithmBermWSBD:
         ds = alg.execute()
         ds.serialize("tests/testdata/output/fc_alg_pl_wsbd_fill_ditch.stix")
 
-    def test_execute_fill_ditch(self):
-        ds = DStability.from_stix("tests/testdata/stix/fc_alg_pl_wsbd.stix")
+    def test_execute_fill_ditch(self, ds_fc_alg_pl_wsbd):
         alg = AlgorithmBermWSBD(
-            ds=ds,
+            ds=ds_fc_alg_pl_wsbd,
             soilcode="Dijksmateriaal (klei)_K3_CPhi",
             slope_top=10,
             slope_bottom=1,
@@ -9,8 +9,9 @@ class TestAlgorithmCut:
         ds = alg.execute()
         ds.serialize("tests/testdata/output/simple_geometry_cut.stix")
 
-    def test_complex_geometry(self):
-        ds = DStability.from_stix("tests/testdata/stix/fc_alg_pl_wsbd.stix")
-        alg = AlgorithmCut(ds=ds, points=[(-100, 3), (40, -1.5), (130.496, -1.5)])
+    def test_complex_geometry(self, ds_fc_alg_pl_wsbd):
+        alg = AlgorithmCut(
+            ds=ds_fc_alg_pl_wsbd, points=[(-100, 3), (40, -1.5), (130.496, -1.5)]
+        )
         ds = alg.execute()
         ds.serialize("tests/testdata/output/fc_alg_pl_wsbd_cut.stix")
@@ -5,9 +5,10 @@ from leveelogic.deltares.dstability import DStability
 
 
 class TestAlgorithmFCPhreaticLineWSBD:
-    def test_execute(self):
-        ds = DStability.from_stix("tests/testdata/stix/fc_alg_pl_wsbd.stix")
-        alg = AlgorithmFCPhreaticLineWSBD(ds=ds, min_level=2.0, max_level=5.0, step=0.5)
+    def test_execute(self, ds_fc_alg_pl_wsbd):
+        alg = AlgorithmFCPhreaticLineWSBD(
+            ds=ds_fc_alg_pl_wsbd, min_level=2.0, max_level=5.0, step=0.5
+        )
         result = alg.execute_multiple_results()
 
         for i, ds in enumerate(result):
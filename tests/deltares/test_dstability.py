@@ -1,4 +1,5 @@
 import pytest
+from copy import deepcopy
 
 from leveelogic.deltares.dstability import DStability
 
@@ -12,6 +13,15 @@ class TestDStability:
         assert ds.num_scenarios == 1
         assert ds.num_stages(0) == 1
 
+    def test_deepcopy(self):
+        ds = DStability.from_stix("tests/testdata/stix/simple_geometry.stix")
+        org_phreatic_line_points = ds.phreatic_line_points
+        ds_copy = deepcopy(ds)
+        assert ds_copy.model is not ds.model
+        assert ds_copy.surface == ds.surface
+        ds_copy.set_phreatic_line([(ds_copy.left, 1.0), (ds_copy.right, 1.0)])
+        assert ds.phreatic_line_points == org_phreatic_line_points
+
     def test_parse_complex(self):
         ds = DStability.from_stix("tests/testdata/stix/complex_geometry.stix")
 
@@ -62,6 +72,16 @@ class TestDStability:
         spgs = ds.soilpolygons
         assert len(spgs) == len(ds.model.datastructure.soillayers[0].SoilLayers)
 
+    def test_z_at_many(self):
+        ds = DStability.from_stix("tests/testdata/stix/simple_geometry.stix")
+        xs = [p[0] for p in ds.surface]
+        zs = ds.z_at_many(xs)
+        assert len(zs) == len(xs)
+        # on the surface points themselves the interpolation should
+        # return the surface z coordinates
+        for (x, z_surface), z in zip(ds.surface, zs):
+            assert z == pytest.approx(z_surface)
+
     def test_soilprofile1_at(self):
         ds = DStability.from_stix("tests/testdata/stix/fc_pl_sample.stix")
         sp1 = ds.soilprofile1_at(x=256)
@@ -0,0 +1,49 @@
+from leveelogic.helpers import (
+    polyline_polyline_intersections,
+    polyline_polyline_intersections_np,
+)
+
+
+class TestPolylinePolylineIntersections:
+    def test_single_intersection(self):
+        intersections = polyline_polyline_intersections_np(
+            [(0.0, 0.0), (10.0, 10.0)], [(0.0, 10.0), (10.0, 0.0)]
+        )
+        assert intersections == [(5.0, 5.0)]
+
+    def test_multiple_intersections_sorted_on_x(self):
+        # horizontal line through a triangular bump
+        intersections = polyline_polyline_intersections_np(
+            [(0.0, 1.0), (10.0, 1.0)],
+            [(0.0, 0.0), (5.0, 2.0), (10.0, 0.0)],
+        )
+        assert intersections == [(2.5, 1.0), (7.5, 1.0)]
+
+    def test_no_intersections(self):
+        intersections = polyline_polyline_intersections_np(
+            [(0.0, 5.0), (10.0, 5.0)], [(0.0, 0.0), (10.0, 0.0)]
+        )
+        assert intersections == []
+
+    def test_intersection_on_shared_segment_point(self):
+        # the crossing lies exactly on a vertex of the second polyline
+        # and should only be reported once
+        intersections = polyline_polyline_intersections_np(
+            [(0.0, 1.0), (10.0, 1.0)],
+            [(0.0, 0.0), (5.0, 1.0), (10.0, 0.0)],
+        )
+        assert intersections == [(5.0, 1.0)]
+
+    def test_wrapper_excludes_points_on_line1(self):
+        # the intersection coincides with a vertex of the first polyline
+        # and is not a vertex of the second so the wrapper drops it
+        intersections = polyline_polyline_intersections(
+            [(0.0, 0.0), (5.0, 0.0), (10.0, 0.0)], [(5.0, -1.0), (5.0, 1.0)]
+        )
+        assert intersections == []
+
+    def test_wrapper_keeps_non_vertex_intersections(self):
+        intersections = polyline_polyline_intersections(
+            [(5.0, 1.0), (5.0, -1.0)], [(0.0, 0.0), (10.0, 0.0)]
+        )
+        assert intersections == [(5.0, 0.0)]